@@ -5,107 +5,246 @@ with average test accuracies and failure information.
 """
 
 import os
+import sys
 import json
 import pandas as pd
 import argparse
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def check_replicate_status(replicate_path):
+# pyarrow is optional; without it pandas writes the CSV
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+
+# timing_check.py writes global_accuracy_results.json with json.dump, which always formats the flag this way
+TIME_EXCEEDED_TRUE = b'"time_exceeded": true'
+TIME_EXCEEDED_FALSE = b'"time_exceeded": false'
+
+
+def decode_json(data):
+    """
+    Decode JSON bytes, using orjson when it is installed.
+
+    Returns:
+        The decoded JSON object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path):
+    """
+    Read and decode a JSON file.
+
+    Returns:
+        The decoded JSON object
+    """
+    with open(path, 'rb') as f:
+        return decode_json(f.read())
+
+
+def read_time_exceeded(path):
     """
-    Check the status of a replicate directory.
+    Read the time_exceeded flag from a global_accuracy_results.json file.
+
+    A byte search answers the common case without decoding; files that are not
+    formatted as expected (or look truncated) are fully decoded instead.
 
     Returns:
-        tuple: (is_valid, failure_reason)
+        bool: True if the time limit was exceeded
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    # A complete json.dump object ends with its closing brace
+    if data.rstrip().endswith(b'}'):
+        if TIME_EXCEEDED_FALSE in data:
+            return False
+        if TIME_EXCEEDED_TRUE in data:
+            return True
+
+    return bool(decode_json(data).get('time_exceeded', False))
+
+
+def save_csv(df, output_path):
+    """
+    Write a DataFrame to CSV without its index, using pyarrow's C++ writer when it is installed.
+
+    Args:
+        df: DataFrame to save
+        output_path: Path of the CSV file to write
+    """
+    if pa is None:
+        df.to_csv(output_path, index=False)
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pa_csv.write_csv(table, output_path, pa_csv.WriteOptions(quoting_style='needed'))
+
+
+def load_replicate(replicate_path, file_names=None):
+    """
+    Check the status of a replicate directory and read its test accuracy, opening each file once.
+
+    Args:
+        replicate_path: Path to the replicate directory
+        file_names: Names of the files in the replicate directory, if already listed (default: scan it)
+
+    Returns:
+        tuple: (is_valid, failure_reason, test_accuracy)
             - is_valid: True if replicate can be used for averaging
             - failure_reason: None, 'memory-limit', or 'time-limit'
+            - test_accuracy: float or None if not found
     """
-    replicate_dir = Path(replicate_path)
-
-    # Check if directory is empty
-    if not any(replicate_dir.iterdir()):
-        return False, 'memory-limit'
+    # Single scandir proves the directory exists, is non-empty, and tells us which files are present
+    if file_names is None:
+        file_names = _scan_names(replicate_path)
 
-    # Check if global_accuracy_results.json exists
-    global_results_path = replicate_dir / 'global_accuracy_results.json'
-    if not global_results_path.exists():
-        return False, 'memory-limit'
+    # Check if directory is empty or global_accuracy_results.json is missing
+    if 'global_accuracy_results.json' not in file_names:
+        return False, 'memory-limit', None
 
     # Check if time_exceeded is True
+    global_results_path = os.path.join(replicate_path, 'global_accuracy_results.json')
     try:
-        with open(global_results_path, 'r') as f:
-            global_results = json.load(f)
-            if global_results.get('time_exceeded', False):
-                return False, 'time-limit'
+        if read_time_exceeded(global_results_path):
+            return False, 'time-limit', None
     except (json.JSONDecodeError, IOError) as e:
         print(f"Warning: Could not read {global_results_path}: {e}")
-        return False, 'memory-limit'
+        return False, 'memory-limit', None
 
     # Check if best_model_results.json exists
-    best_model_path = replicate_dir / 'best_model_results.json'
-    if not best_model_path.exists():
-        return False, 'memory-limit'
+    if 'best_model_results.json' not in file_names:
+        return False, 'memory-limit', None
 
-    return True, None
+    # Extract test_accuracy from best_model_results.json
+    best_model_path = os.path.join(replicate_path, 'best_model_results.json')
+    try:
+        best_model_results = load_json(best_model_path)
+        return True, None, best_model_results.get('test_accuracy', None)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Warning: Could not read {best_model_path}: {e}")
+        return True, None, None
 
 
-def get_test_accuracy(replicate_path):
+def _scan_entries(path, dirs_only=False):
     """
-    Extract test_accuracy from best_model_results.json.
+    List a directory once with os.scandir.
 
     Returns:
-        float or None: test_accuracy value or None if not found
+        dict: {entry_name: os.DirEntry}, empty if the directory does not exist
     """
-    best_model_path = Path(replicate_path) / 'best_model_results.json'
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it if not dirs_only or entry.is_dir()}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
 
+def _scan_names(path):
+    """
+    List the entry names of a directory once with os.scandir.
+
+    Returns:
+        set: Entry names, empty if the directory is empty or does not exist
+    """
     try:
-        with open(best_model_path, 'r') as f:
-            best_model_results = json.load(f)
-            return best_model_results.get('test_accuracy', None)
-    except (json.JSONDecodeError, IOError) as e:
-        print(f"Warning: Could not read {best_model_path}: {e}")
-        return None
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
 
 
-def process_task_model(timing_results_dir, model_name, task_id, num_replicates=10):
+def build_results_index(timing_results_dir, model_dirs):
+    """
+    Index the Timing_Results tree up front so the aggregation loop needs no further stat calls.
+
+    Args:
+        timing_results_dir: Path to Timing_Results directory
+        model_dirs: Names of the ML model directories (e.g., 'DT_Timing')
+
+    Returns:
+        dict: {model_dir: {task_name: {replicate_name: {file_name, ...}}}}
+    """
+    index = {}
+    for model_dir in model_dirs:
+        task_entries = _scan_entries(os.path.join(timing_results_dir, model_dir), dirs_only=True)
+        index[model_dir] = {
+            task_name: {
+                replicate_name: _scan_names(replicate_entry.path)
+                for replicate_name, replicate_entry in _scan_entries(task_entry.path, dirs_only=True).items()
+            }
+            for task_name, task_entry in task_entries.items()
+        }
+    return index
+
+
+def process_task_model(timing_results_dir, model_name, task_id, task_index, num_replicates=10):
     """
-    Process results for a specific task and model combination.
+    Collect the replicate jobs for a specific task and model combination.
 
     Args:
         timing_results_dir: Path to Timing_Results directory
         model_name: Name of the ML model (e.g., 'DT_Timing')
         task_id: Task ID (e.g., '146818')
+        task_index: {replicate_name: {file_name, ...}} for the task, or None if the task folder does not exist
         num_replicates: Number of replicates to check (default: 10)
 
     Returns:
-        tuple: (avg_test_accuracy, failure_reason)
-            - avg_test_accuracy: float or None
-            - failure_reason: 'None', 'memory-limit', or 'time-limit'
+        list: (model_name, task_id, replicate_path, replicate_files) jobs, empty if the task folder does not exist
     """
-    task_path = Path(timing_results_dir) / model_name / f'task_{task_id}'
+    if task_index is None:
+        return []
 
-    if not task_path.exists():
-        return None, 'None'
+    # Plain string joins; these paths are only handed to os.scandir/open
+    task_path = os.path.join(timing_results_dir, model_name, f'task_{task_id}')
 
-    test_accuracies = []
-    failure_reasons = set()
+    return [(model_name, task_id, os.path.join(task_path, f'Replicate_{i}'), task_index.get(f'Replicate_{i}'))
+            for i in range(num_replicates)]
 
-    for i in range(num_replicates):
-        replicate_path = task_path / f'Replicate_{i}'
 
-        if not replicate_path.exists():
-            failure_reasons.add('memory-limit')
-            continue
+def _run_replicate_job(job):
+    """
+    Load a single replicate job produced by process_task_model.
 
-        is_valid, failure_reason = check_replicate_status(replicate_path)
+    Returns:
+        tuple: (model_name, task_id, test_accuracy, failure_reason)
+            - test_accuracy: float or None
+            - failure_reason: None, 'memory-limit', or 'time-limit'
+    """
+    model_name, task_id, replicate_path, replicate_files = job
 
-        if not is_valid:
-            failure_reasons.add(failure_reason)
-        else:
-            test_accuracy = get_test_accuracy(replicate_path)
-            if test_accuracy is not None:
-                test_accuracies.append(test_accuracy)
+    # Replicate folder was not found while indexing
+    if replicate_files is None:
+        return model_name, task_id, None, 'memory-limit'
+
+    _, failure_reason, test_accuracy = load_replicate(replicate_path, replicate_files)
+    return model_name, task_id, test_accuracy, failure_reason
 
+
+def summarize_task_model(test_accuracies, failure_reasons):
+    """
+    Reduce the replicate results of a task and model combination.
+
+    Args:
+        test_accuracies: List of test accuracies from valid replicates
+        failure_reasons: Set of failure reasons from invalid replicates
+
+    Returns:
+        tuple: (avg_test_accuracy, failure_reason)
+            - avg_test_accuracy: float or None
+            - failure_reason: 'None', 'memory-limit', or 'time-limit'
+    """
     # Determine overall failure status
     if 'memory-limit' in failure_reasons:
         overall_failure = 'memory-limit'
@@ -122,7 +261,7 @@ def process_task_model(timing_results_dir, model_name, task_id, num_replicates=1
     return avg_test_accuracy, overall_failure
 
 
-def aggregate_results(tasks_summary_path, timing_results_dir, output_path=None, threshold=None):
+def aggregate_results(tasks_summary_path, timing_results_dir, output_path=None, threshold=None, max_workers=16, verbose=False):
     """
     Main function to aggregate results and update tasks_summary.csv.
 
@@ -131,43 +270,61 @@ def aggregate_results(tasks_summary_path, timing_results_dir, output_path=None,
         timing_results_dir: Path to Timing_Results directory
         output_path: Path to save updated CSV (default: overwrites input)
         threshold: Float threshold to filter out tasks with any model performance >= threshold
+        max_workers: Number of threads used to load replicate JSON files (default: 16)
+        verbose: Print per-task progress while aggregating (default: False)
     """
     # Read the tasks summary CSV
     df = pd.read_csv(tasks_summary_path)
 
     # Get list of ML models (directories ending in '_Timing')
-    timing_results_path = Path(timing_results_dir)
-    model_dirs = [d.name for d in timing_results_path.iterdir()
-                  if d.is_dir() and d.name.endswith('_Timing')]
+    model_dirs = [name for name in _scan_entries(timing_results_dir, dirs_only=True)
+                  if name.endswith('_Timing')]
     model_dirs.sort()
+    # (model_dir, model_name) pairs, e.g. ('DT_Timing', 'DT')
+    models = [(model_dir, model_dir[:-len('_Timing')]) for model_dir in model_dirs]
 
     print(f"Found {len(model_dirs)} ML models: {', '.join(model_dirs)}")
     print(f"Processing {len(df)} tasks...")
 
-    # Initialize new columns
-    for model_dir in model_dirs:
-        # Extract model name (e.g., 'DT' from 'DT_Timing')
-        model_name = model_dir.replace('_Timing', '')
-        df[model_name] = None
+    # Index the directory tree once; afterwards the JSON reads are the only I/O
+    index = build_results_index(timing_results_dir, model_dirs)
 
-    # Add single Failure column for all models
-    df['Failure'] = 'None'
+    # Build every replicate job up front so file loading can be spread over a thread pool
+    jobs = []
+    for task_id in df['task_id'].astype(str):
+        for model_dir in model_dirs:
+            jobs.extend(process_task_model(
+                timing_results_dir, model_dir, task_id, index[model_dir].get(f'task_{task_id}')
+            ))
+
+    # (model_dir, task_id) -> (test_accuracies, failure_reasons)
+    replicate_results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for model_dir, task_id, test_accuracy, failure in executor.map(_run_replicate_job, jobs):
+            test_accuracies, failure_reasons = replicate_results.setdefault((model_dir, task_id), ([], set()))
+            if failure is not None:
+                failure_reasons.add(failure)
+            elif test_accuracy is not None:
+                test_accuracies.append(test_accuracy)
+
+    # Buffer new columns in plain lists; each model gets one column
+    model_results = {model_name: [None] * len(df) for _, model_name in models}
+    # Single Failure column for all models
+    task_failure_column = ['None'] * len(df)
 
     # Process each task
-    for idx, row in df.iterrows():
-        task_id = str(row['task_id'])
-        print(f"Processing task {task_id}...")
+    for idx, task_id in enumerate(df['task_id'].astype(str)):
+        if verbose:
+            print(f"Processing task {task_id}...")
 
         task_failures = set()
 
-        for model_dir in model_dirs:
-            model_name = model_dir.replace('_Timing', '')
-
-            avg_accuracy, failure = process_task_model(
-                timing_results_dir, model_dir, task_id
+        for model_dir, model_name in models:
+            avg_accuracy, failure = summarize_task_model(
+                *replicate_results.get((model_dir, task_id), ([], set()))
             )
 
-            df.at[idx, model_name] = avg_accuracy
+            model_results[model_name][idx] = avg_accuracy
 
             # Track failures across all models for this task
             if failure != 'None':
@@ -176,11 +333,14 @@ def aggregate_results(tasks_summary_path, timing_results_dir, output_path=None,
         # Set overall failure status for the task
         # Priority: memory-limit > time-limit > None
         if 'memory-limit' in task_failures:
-            df.at[idx, 'Failure'] = 'memory-limit'
+            task_failure_column[idx] = 'memory-limit'
         elif 'time-limit' in task_failures:
-            df.at[idx, 'Failure'] = 'time-limit'
-        else:
-            df.at[idx, 'Failure'] = 'None'
+            task_failure_column[idx] = 'time-limit'
+
+    # Assign whole columns at once instead of writing cell by cell
+    for model_name, column in model_results.items():
+        df[model_name] = column
+    df['Failure'] = task_failure_column
 
     # Filter out tasks with failures (keep only tasks where Failure == 'None')
     df_filtered = df[df['Failure'] == 'None'].copy()
@@ -188,34 +348,24 @@ def aggregate_results(tasks_summary_path, timing_results_dir, output_path=None,
     # Apply threshold filtering if specified
     if threshold is not None:
         print(f"\nApplying threshold filter: removing tasks with any model performance >= {threshold}")
-        tasks_to_keep = []
-        for idx, row in df_filtered.iterrows():
-            exceeds_threshold = False
-            for model_dir in model_dirs:
-                model_name = model_dir.replace('_Timing', '')
-                accuracy = row[model_name]
-                if accuracy is not None and accuracy >= threshold:
-                    exceeds_threshold = True
-                    break
-            if not exceeds_threshold:
-                tasks_to_keep.append(idx)
-
-        df_filtered = df_filtered.loc[tasks_to_keep].copy()
-
-    # Print test performance for tasks that made it to the final CSV
-    print("\n" + "="*60)
-    print("Tasks included in final CSV:")
-    print("="*60)
+        # Coerce once so all-missing (object) columns compare as float NaN in a single vectorized pass
+        accuracies = df_filtered[[model_name for _, model_name in models]].apply(pd.to_numeric, errors='coerce')
+        # Keep tasks where every model is below threshold or has no accuracy
+        keep = (accuracies.lt(threshold) | accuracies.isna()).all(axis=1)
+        df_filtered = df_filtered.loc[keep].copy()
+
+    # Print test performance for tasks that made it to the final CSV, buffered into a single write
+    lines = ["\n" + "="*60, "Tasks included in final CSV:", "="*60]
     for idx, row in df_filtered.iterrows():
         task_id = str(row['task_id'])
-        print(f"\nTask {task_id} Results:")
-        for model_dir in model_dirs:
-            model_name = model_dir.replace('_Timing', '')
+        lines.append(f"\nTask {task_id} Results:")
+        for _, model_name in models:
             accuracy = row[model_name]
-            if accuracy is not None:
-                print(f"  {model_name}: {accuracy:.6f}")
+            if pd.notna(accuracy):
+                lines.append(f"  {model_name}: {accuracy:.6f}")
             else:
-                print(f"  {model_name}: N/A")
+                lines.append(f"  {model_name}: N/A")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
     # Drop the Failure column from the filtered results
     df_filtered = df_filtered.drop(columns=['Failure'])
@@ -233,7 +383,7 @@ def aggregate_results(tasks_summary_path, timing_results_dir, output_path=None,
     if output_path is None:
         output_path = tasks_summary_path
 
-    df_filtered.to_csv(output_path, index=False)
+    save_csv(df_filtered, output_path)
     print(f"\nResults saved to: {output_path}")
     print(f"Added {len(model_dirs)} model columns (Failure column excluded from final output)")
 
@@ -266,6 +416,17 @@ def main():
         default=None,
         help='Threshold to filter out tasks where any model performance >= threshold'
     )
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=16,
+        help='Number of threads used to load replicate results (default: 16)'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Print per-task progress while aggregating'
+    )
 
     args = parser.parse_args()
 
@@ -279,7 +440,8 @@ def main():
         return 1
 
     # Run aggregation
-    aggregate_results(args.tasks_csv, args.timing_results, args.output, args.threshold)
+    aggregate_results(args.tasks_csv, args.timing_results, args.output, args.threshold,
+                      args.max_workers, args.verbose)
     return 0
 
 
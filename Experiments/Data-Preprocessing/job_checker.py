@@ -5,17 +5,21 @@ Outputs ML model, OpenML task id, and SLURM array id for any empty folders.
 """
 
 import os
+import sys
 import argparse
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Task IDs from runner.sb in the correct order
-TASK_IDS = [
+TASK_IDS = (
     190412, 146818, 359955, 168757, 359956, 359958, 359962, 190137, 168911, 190392,
     189922, 359965, 359966, 359967, 190411, 146820, 359968, 359975, 359972, 168350,
     359973, 190410, 359971, 359988, 359989, 359979, 359980, 359992, 359982, 167120,
     359990, 189354, 360114, 359994
-]
+)
+
+# Task ID -> index in TASK_IDS (the TASK_INDEX used by runner.sb)
+TASK_INDEX = {task_id: task_index for task_index, task_id in enumerate(TASK_IDS)}
 
 # Number of replicates per task
 NUM_REPLICATES = 10
@@ -37,35 +41,108 @@ def is_folder_empty(folder_path):
     Check if a folder is empty or doesn't exist.
 
     Args:
-        folder_path: Path to the folder to check
+        folder_path: Path (or os.DirEntry) of the folder to check
 
     Returns:
         True if folder is empty or doesn't exist, False otherwise
     """
-    if not os.path.exists(folder_path):
+    # Pull a single entry instead of materializing the full listing
+    try:
+        with os.scandir(folder_path) as it:
+            return next(it, None) is None
+    except (FileNotFoundError, NotADirectoryError):
         return True
 
-    if not os.path.isdir(folder_path):
-        return True
 
-    # Check if directory has any files or subdirectories
-    return len(os.listdir(folder_path)) == 0
+def list_subfolders(folder_path):
+    """
+    List the subfolders of a folder with a single os.scandir call.
 
+    Args:
+        folder_path: Path (or os.DirEntry) of the folder to list
 
-def calculate_array_id(task_index, replicate):
+    Returns:
+        Dictionary of {name: os.DirEntry} for each subfolder, or None if the folder doesn't exist
     """
-    Calculate the SLURM array ID based on task index and replicate number.
+    try:
+        with os.scandir(folder_path) as it:
+            # DirEntry caches the file type, so is_dir() needs no extra stat
+            return {entry.name: entry for entry in it if entry.is_dir()}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def index_model_folder(model_path):
+    """
+    Cache the task and replicate folder listings of a model folder in one walk.
+
+    Args:
+        model_path: Path to the model folder (e.g., Timing_Results/DT_Timing)
+
+    Returns:
+        Dictionary of {task_folder: {replicate_folder: os.DirEntry}}, or None if the model folder doesn't exist
+    """
+    task_entries = list_subfolders(model_path)
+    if task_entries is None:
+        return None
+
+    return {name: list_subfolders(entry) or {} for name, entry in task_entries.items()}
+
+
+def calculate_array_id(task_id, replicate):
+    """
+    Calculate the SLURM array ID based on task ID and replicate number.
 
     Formula: SLURM_ARRAY_TASK_ID = TASK_INDEX * NUM_REPLICATES + REP
 
     Args:
-        task_index: Index in the TASK_IDS array
+        task_id: OpenML task ID from TASK_IDS
         replicate: Replicate number (0-9)
 
     Returns:
         The SLURM array ID
     """
-    return task_index * NUM_REPLICATES + replicate
+    return TASK_INDEX[task_id] * NUM_REPLICATES + replicate
+
+
+def scan_model_folder(timing_results_dir, model_folder, model_name):
+    """
+    Find the empty replicate folders of a single model.
+
+    Args:
+        timing_results_dir: Path to the Timing_Results directory
+        model_folder: Name of the model folder (e.g., DT_Timing)
+        model_name: Model name reported in the output (e.g., DT)
+
+    Returns:
+        List of (model_name, task_id, replicate, array_id) for every empty replicate,
+        or None if the model folder doesn't exist
+    """
+    # Listings are cached up front, so the loops below are dict lookups
+    model_index = index_model_folder(os.path.join(timing_results_dir, model_folder))
+    if model_index is None:
+        return None
+
+    empty_replicates = []
+
+    # Iterate through task IDs in order
+    for task_id in TASK_IDS:
+        replicate_entries = model_index.get(f"task_{task_id}")
+
+        if replicate_entries is None:
+            # If task folder doesn't exist, all replicates are missing
+            for rep in range(NUM_REPLICATES):
+                empty_replicates.append((model_name, task_id, rep, calculate_array_id(task_id, rep)))
+            continue
+
+        # Check each replicate folder
+        for rep in range(NUM_REPLICATES):
+            replicate_entry = replicate_entries.get(f"Replicate_{rep}")
+
+            if replicate_entry is None or is_folder_empty(replicate_entry):
+                empty_replicates.append((model_name, task_id, rep, calculate_array_id(task_id, rep)))
+
+    return empty_replicates
 
 
 def check_timing_results(timing_results_dir):
@@ -75,79 +152,65 @@ def check_timing_results(timing_results_dir):
     Args:
         timing_results_dir: Path to the Timing_Results directory
     """
-    timing_results_path = Path(timing_results_dir)
-
-    if not timing_results_path.exists():
+    if not os.path.isdir(timing_results_dir):
         print(f"ERROR: Directory does not exist: {timing_results_dir}")
         return
 
-    print("=" * 80)
-    print("Checking for empty replicate folders...")
-    print("=" * 80)
-    print(f"{'Model':<15} {'Task ID':<10} {'Replicate':<10} {'Array ID':<10}")
-    print("-" * 80)
-
-    empty_count = 0
+    # (model_folder, model_name) pairs, e.g. ("DT_Timing", "DT")
+    models = [(model_folder, model_folder[:-len("_Timing")]) for model_folder in MODEL_FOLDERS]
     # Dictionary to store array IDs per model
-    model_array_ids = {model.replace("_Timing", ""): [] for model in MODEL_FOLDERS}
-
-    # Iterate through each model folder
-    for model_folder in MODEL_FOLDERS:
-        model_path = timing_results_path / model_folder
-        model_name = model_folder.replace("_Timing", "")
-
-        if not model_path.exists():
-            print(f"WARNING: Model folder not found: {model_folder}")
+    model_array_ids = {model_name: [] for _, model_name in models}
+    # (model_name, task_id, replicate, array_id) for every empty replicate, reported after the walk
+    empty_replicates = []
+    # Report lines, written to stdout in one call at the end
+    lines = []
+
+    # Model folders are independent trees; scan them concurrently since the work is filesystem latency
+    with ThreadPoolExecutor(max_workers=len(models)) as executor:
+        model_scans = list(executor.map(lambda model: scan_model_folder(timing_results_dir, *model), models))
+
+    # Merge in MODEL_FOLDERS order so the report is deterministic
+    for (model_folder, model_name), model_empty_replicates in zip(models, model_scans):
+        if model_empty_replicates is None:
+            lines.append(f"WARNING: Model folder not found: {model_folder}")
             continue
 
-        # Iterate through task IDs in order
-        for task_index, task_id in enumerate(TASK_IDS):
-            task_folder_name = f"task_{task_id}"
-            task_path = model_path / task_folder_name
-
-            if not task_path.exists():
-                # If task folder doesn't exist, all replicates are missing
-                for rep in range(NUM_REPLICATES):
-                    array_id = calculate_array_id(task_index, rep)
-                    print(f"{model_name:<15} {task_id:<10} {rep:<10} {array_id:<10}")
-                    model_array_ids[model_name].append(array_id)
-                    empty_count += 1
-                continue
-
-            # Check each replicate folder
-            for rep in range(NUM_REPLICATES):
-                replicate_folder_name = f"Replicate_{rep}"
-                replicate_path = task_path / replicate_folder_name
+        empty_replicates.extend(model_empty_replicates)
+        model_array_ids[model_name] = [array_id for _, _, _, array_id in model_empty_replicates]
 
-                if is_folder_empty(replicate_path):
-                    array_id = calculate_array_id(task_index, rep)
-                    print(f"{model_name:<15} {task_id:<10} {rep:<10} {array_id:<10}")
-                    model_array_ids[model_name].append(array_id)
-                    empty_count += 1
+    lines.append("=" * 80)
+    lines.append("Checking for empty replicate folders...")
+    lines.append("=" * 80)
+    lines.append(f"{'Model':<15} {'Task ID':<10} {'Replicate':<10} {'Array ID':<10}")
+    lines.append("-" * 80)
 
-    print("-" * 80)
-    print(f"Total empty replicate folders found: {empty_count}")
-    print("=" * 80)
+    for model_name, task_id, rep, array_id in empty_replicates:
+        lines.append(f"{model_name:<15} {task_id:<10} {rep:<10} {array_id:<10}")
+
+    lines.append("-" * 80)
+    lines.append(f"Total empty replicate folders found: {len(empty_replicates)}")
+    lines.append("=" * 80)
 
     # Print array IDs per model
-    print("\n" + "=" * 80)
-    print("Array IDs to Rerun by Model")
-    print("=" * 80)
+    lines.append("\n" + "=" * 80)
+    lines.append("Array IDs to Rerun by Model")
+    lines.append("=" * 80)
 
-    for model_name in [m.replace("_Timing", "") for m in MODEL_FOLDERS]:
+    for _, model_name in models:
         array_ids = model_array_ids[model_name]
+        # Tasks and replicates are walked in index order, so array IDs are already sorted
         if array_ids:
-            # Sort array IDs for cleaner output
-            array_ids.sort()
-            print(f"\n{model_name}:")
-            print(f"  Count: {len(array_ids)}")
-            print(f"  Array IDs: {','.join(map(str, array_ids))}")
+            lines.append(f"\n{model_name}:")
+            lines.append(f"  Count: {len(array_ids)}")
+            lines.append(f"  Array IDs: {','.join(map(str, array_ids))}")
         else:
-            print(f"\n{model_name}:")
-            print(f"  Count: 0")
-            print(f"  All replicates complete!")
+            lines.append(f"\n{model_name}:")
+            lines.append(f"  Count: 0")
+            lines.append(f"  All replicates complete!")
+
+    lines.append("\n" + "=" * 80)
 
-    print("\n" + "=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -1,13 +1,16 @@
 from typeguard import typechecked
 from typing import Dict, Any
-import copy as cp
 
-@typechecked
 class Individual:
     """
     This class encapsulates a set of hyperparameters (the "params") and stores additional information,
     such as the performance (accuracy), expected improvement (ei), and cross-validation training score (cv_train_score).
     """
+    # Many individuals are created per generation; slots drop the per-instance __dict__
+    __slots__ = ('train_performance', 'val_performance', 'ei', 'params', 'model_type')
+
+    # Only the constructor is type checked; getters/setters are called in the search loops
+    @typechecked
     def __init__(self, params: Dict[str, Any], model_type: str):
         """
         Parameters:
@@ -55,5 +58,5 @@ class Individual:
         return self.ei
 
     def get_params(self) -> Dict[str, Any]:
-        # return a deep copy to avoid accidental modifications
-        return cp.deepcopy(self.params)
\ No newline at end of file
+        # return a shallow copy to avoid accidental modifications (hyperparameter values are immutable scalars)
+        return self.params.copy()
\ No newline at end of file
@@ -225,7 +225,7 @@ class TPE:
             raise RuntimeError("Need at least 2 samples before TPE can fit.")
 
         # Sort population/samples set (lowest/best first)
-        samples.sort(key=lambda o: o.get_val_performance())
+        samples.sort(key=Individual.get_val_performance)
         split_idx = max(1, int(len(samples) * self.gamma))
         good_samples = samples[:split_idx]
         bad_samples = samples[split_idx:]
@@ -251,9 +251,10 @@ class TPE:
         # For each sample set, extract values of numeric hyperparameters
         # Format shape (n_params, n_samples): [[value11, value12,...], [value21, value22, ...], ...]
         # Each parameter has its own row
-        good_num_samples = np.array([[o.get_params()[param_name] for o in good_samples]
+        # Values are only read here, so access params directly instead of copying them through get_params()
+        good_num_samples = np.array([[o.params[param_name] for o in good_samples]
                             for param_name in numeric_params])
-        bad_num_samples = np.array([[o.get_params()[param_name] for o in bad_samples]
+        bad_num_samples = np.array([[o.params[param_name] for o in bad_samples]
                             for param_name in numeric_params])
 
         # Fit Multivariate KDEs
@@ -268,7 +269,7 @@ class TPE:
         self.cat_l = {
             param_name: CategoricalPMF(
                 # Extract categorical values from samples in (d, n) format
-                values = [o.get_params()[param_name] for o in good_samples],
+                values = [o.params[param_name] for o in good_samples],
                 all_categories = info["bounds"]
             )
             for param_name, info in categorical_params.items()
@@ -276,7 +277,7 @@ class TPE:
 
         self.cat_g = {
             param_name : CategoricalPMF(
-                values = [o.get_params()[param_name] for o in bad_samples],
+                values = [o.params[param_name] for o in bad_samples],
                 all_categories = info["bounds"]
             )
             for param_name, info in categorical_params.items()